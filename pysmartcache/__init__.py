@@ -1,4 +1,4 @@
-from pysmartcache import clients, constants, engine, exceptions, utils
+from pysmartcache import clients, constants, engine, exceptions, footprint, hotkeys, snapshot, utils
 from pysmartcache.engine import cache
 
 __all__ = [
@@ -6,6 +6,9 @@ __all__ = [
     'constants',
     'engine',
     'exceptions',
+    'footprint',
+    'hotkeys',
+    'snapshot',
     'utils',
 
     'cache',
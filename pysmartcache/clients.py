@@ -1,3 +1,4 @@
+import math
 import os
 import pickle
 
@@ -37,6 +38,19 @@ class CacheClient(object):
     def purge(self):
         raise NotImplementedError()  # pragma: no cover
 
+    def scan_keys(self, pattern, batch_size=1000):
+        raise NotImplementedError('{} client does not support scanning keys.'.format(self.name))
+
+    def get_entries(self, keys):
+        raise NotImplementedError('{} client does not support reading raw entries.'.format(self.name))
+
+    def get_entry_sizes(self, keys):
+        raise NotImplementedError('{} client does not support reading entry sizes.'.format(self.name))
+
+    def restore_entries(self, entries):
+        for key, payload, ttl in entries:
+            self.set(key, pickle.loads(payload), None if ttl is None else int(math.ceil(ttl)))
+
 
 class DjangoClient(CacheClient):
     requires_host_configuration = False
@@ -74,7 +88,7 @@ class MemcachedClient(CacheClient):
         return CACHE_MISS
 
     def set(self, key, value, ttl):
-        self._get_client().set(key, pickle.dumps(value), ttl)
+        self._get_client().set(key, pickle.dumps(value), ttl or 0)  # 0 means no expiration for memcached.
 
     def purge(self):
         self._get_client().flush_all()
@@ -100,3 +114,42 @@ class RedisClient(CacheClient):
 
     def purge(self):
         self._get_client().flushall()
+
+    def scan_keys(self, pattern, batch_size=1000):
+        for key in self._get_client().scan_iter(match=pattern, count=batch_size):
+            yield key.decode('utf-8')
+
+    def get_entries(self, keys):
+        pipeline = self._get_client().pipeline(transaction=False)
+        for key in keys:
+            pipeline.get(key)
+            pipeline.pttl(key)
+        results = pipeline.execute()
+
+        entries = []
+        for key, payload, ttl in zip(keys, results[0::2], results[1::2]):
+            if payload is None or ttl == -2:  # Expired (or deleted) after being scanned.
+                continue
+            entries.append((key, payload, None if ttl == -1 else ttl / 1000.0))
+        return entries
+
+    def get_entry_sizes(self, keys):
+        pipeline = self._get_client().pipeline(transaction=False)
+        for key in keys:
+            pipeline.strlen(key)
+            pipeline.pttl(key)
+            pipeline.execute_command('MEMORY USAGE', key)
+        results = pipeline.execute()
+
+        entry_sizes = []
+        for key, value_size, ttl, memory_usage in zip(keys, results[0::3], results[1::3], results[2::3]):
+            if ttl == -2:  # Expired (or deleted) after being scanned.
+                continue
+            entry_sizes.append((key, value_size, None if ttl == -1 else ttl / 1000.0, memory_usage))
+        return entry_sizes
+
+    def restore_entries(self, entries):
+        pipeline = self._get_client().pipeline(transaction=False)
+        for key, payload, ttl in entries:
+            pipeline.set(key, payload, px=None if ttl is None else max(1, int(ttl * 1000)))
+        pipeline.execute()
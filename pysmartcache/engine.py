@@ -1,10 +1,13 @@
+import functools
+
 from .clients import CacheClient
 from .constants import CACHE_MISS
+from .hotkeys import get_tracker
 from .utils import get_cache_key, get_env_var
 
 
 class cache(object):
-    def __init__(self, keys=None, ttl=None, cache_exception=None, cache_exception_ttl=None, enabled=None):
+    def __init__(self, keys=None, ttl=None, cache_exception=None, cache_exception_ttl=None, enabled=None, hot_keys=None):
         if ttl is None:
             ttl = get_env_var('PYSMARTCACHE_DEFAULT_TTL', int, 3600)
 
@@ -17,40 +20,61 @@ class cache(object):
         if enabled is None:
             enabled = get_env_var('PYSMARTCACHE_DEFAULT_ENABLED', bool, True)
 
+        if hot_keys is None:
+            hot_keys = get_env_var('PYSMARTCACHE_DEFAULT_HOT_KEYS', bool, False)
+
         self.ttl = ttl
         self.keys = keys
         self.cache_exception = cache_exception
         self.cache_exception_ttl = cache_exception_ttl
         self.enabled = enabled
+        self.hot_keys = hot_keys
 
     def get_client(self):
         return CacheClient.instantiate()
 
     def __call__(self, func):
+        @functools.wraps(func)
         def wrapped_f(*args, **kwargs):
             def _execute_decorated_callable():
                 return func(*args, **kwargs)
 
+            def _is_cache_miss(value):
+                return (type(value) == type(CACHE_MISS)) and (value == CACHE_MISS)
+
             _cache_refresh = kwargs.pop('_cache_refresh', False)
 
             if not self.enabled:
                 return _execute_decorated_callable()
 
             full_cache_key = get_cache_key(func, self.keys, *args, **kwargs)
-            client = self.get_client()
-
-            cache_value = client.get(full_cache_key)
-            if ((type(cache_value) == type(CACHE_MISS)) and (cache_value == CACHE_MISS)) or (_cache_refresh):
-                try:
-                    cache_value = _execute_decorated_callable()
-                    ttl = self.ttl
-                except Exception as e:
-                    if not(self.cache_exception):
-                        raise e
-                    cache_value = e
-                    ttl = self.cache_exception_ttl
-
-                client.set(full_cache_key, cache_value, ttl)
+
+            tracker = get_tracker() if self.hot_keys else None
+            is_hot_key = tracker.track(full_cache_key) if tracker else False
+
+            cache_value = CACHE_MISS
+            if is_hot_key and not(_cache_refresh):
+                cache_value = tracker.get_local(full_cache_key)
+
+            if _is_cache_miss(cache_value) or (_cache_refresh):
+                client = self.get_client()
+                cache_value = client.get(full_cache_key)
+                ttl = None  # Unknown remaining TTL when the value comes from the cache client.
+
+                if _is_cache_miss(cache_value) or (_cache_refresh):
+                    try:
+                        cache_value = _execute_decorated_callable()
+                        ttl = self.ttl
+                    except Exception as e:
+                        if not(self.cache_exception):
+                            raise e
+                        cache_value = e
+                        ttl = self.cache_exception_ttl
+
+                    client.set(full_cache_key, cache_value, ttl)
+
+                if is_hot_key:
+                    tracker.set_local(full_cache_key, cache_value, ttl)
 
             if isinstance(cache_value, BaseException):
                 raise cache_value
@@ -1,2 +1,6 @@
 class ImproperlyConfigured(Exception):
     pass
+
+
+class InvalidSnapshot(Exception):
+    pass
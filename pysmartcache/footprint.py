@@ -0,0 +1,223 @@
+import argparse
+import json
+import pickletools
+import random
+import time
+
+from .clients import CacheClient
+from .utils import iter_batches, iter_cache_keys, parse_cache_key
+
+PERCENTILES = (50, 90, 99)
+PAYLOADS_BATCH_SIZE = 10
+NUMERIC_OPCODES = {'INT', 'BININT', 'BININT1', 'BININT2', 'LONG', 'LONG1', 'LONG4', 'FLOAT', 'BINFLOAT'}
+METADATA_OPCODES = {'GLOBAL', 'INST'}
+NON_PUSHING_OPCODES = {'PROTO', 'FRAME', 'MEMOIZE', 'PUT', 'BINPUT', 'LONG_BINPUT'}
+
+
+def percentile(sorted_values, percent):
+    if not sorted_values:
+        return None
+    index = int(round(percent / 100.0 * (len(sorted_values) - 1)))
+    return sorted_values[index]
+
+
+def get_serializer_overhead(payload):
+    # Bytes spent by pickle on opcodes, framing, memoization and type metadata (everything but the actual data).
+    data_size = 0
+    numeric_argument_start = None
+    last_pushed_string_sizes = [0, 0]  # STACK_GLOBAL consumes the last two pushed strings (module and class names).
+    try:
+        for opcode, argument, position in pickletools.genops(payload):
+            if numeric_argument_start is not None:  # Numeric arguments span until the next opcode.
+                data_size += position - numeric_argument_start
+                numeric_argument_start = None
+
+            if opcode.name in METADATA_OPCODES:
+                pass  # Module and class names.
+            elif opcode.name == 'STACK_GLOBAL':
+                data_size -= sum(last_pushed_string_sizes)
+            elif isinstance(argument, str):
+                data_size += len(argument.encode('utf-8', 'surrogatepass'))
+            elif isinstance(argument, (bytes, bytearray)):
+                data_size += len(argument)
+            elif opcode.name in NUMERIC_OPCODES:
+                numeric_argument_start = position + 1
+
+            if opcode.name not in NON_PUSHING_OPCODES:
+                string_size = len(argument.encode('utf-8', 'surrogatepass')) if isinstance(argument, str) else 0
+                last_pushed_string_sizes = [last_pushed_string_sizes[1], string_size]
+    except Exception:  # Not a pickle (or a corrupted one).
+        return None
+    return len(payload) - data_size
+
+
+class FunctionFootprint(object):
+    def __init__(self, qualname, max_samples=10000):
+        self.qualname = qualname
+        self.max_samples = max_samples
+
+        self.entries = 0
+        self.sampled = 0
+        self.entries_without_ttl = 0
+        self.total_value_size = 0
+        self.total_memory_usage = 0
+        self.inspected = 0
+        self.unparsed = 0
+        self.total_serializer_overhead = 0
+        self.total_parsed_value_size = 0  # Only payloads whose serializer overhead could be measured.
+        self._samples = []  # Reservoir of (value size, memory usage, ttl) tuples, used for percentiles.
+
+    def add_sample(self, value_size, ttl, memory_usage):
+        self.sampled += 1
+        self.total_value_size += value_size
+        self.total_memory_usage += memory_usage or 0
+        if ttl is None:
+            self.entries_without_ttl += 1
+
+        sample = (value_size, memory_usage, ttl)
+        if len(self._samples) < self.max_samples:
+            self._samples.append(sample)
+        else:
+            index = random.randrange(self.sampled)
+            if index < self.max_samples:
+                self._samples[index] = sample
+
+    def add_payload(self, payload):
+        serializer_overhead = get_serializer_overhead(payload)
+
+        self.inspected += 1
+        if serializer_overhead is None:
+            self.unparsed += 1
+        else:
+            self.total_serializer_overhead += serializer_overhead
+            self.total_parsed_value_size += len(payload)
+
+    def estimate(self, sampled_total):
+        if not self.sampled:
+            return None
+        return int(sampled_total * self.entries / self.sampled)
+
+    def _percentiles(self, position):
+        values = sorted(sample[position] for sample in self._samples if sample[position] is not None)
+        result = {'p{}'.format(percent): percentile(values, percent) for percent in PERCENTILES}
+        result['max'] = values[-1] if values else None
+        return result
+
+    def as_dict(self):
+        ratio = (self.total_serializer_overhead / self.total_parsed_value_size) if self.total_parsed_value_size else None
+        value_size_total = self.estimate(self.total_value_size)
+        return {
+            'qualname': self.qualname,
+            'entries': self.entries,
+            'sampled': self.sampled,
+            'value_size': dict(total=value_size_total, **self._percentiles(0)),
+            'memory_usage': dict(total=self.estimate(self.total_memory_usage), **self._percentiles(1)),
+            'ttl': dict(without_ttl=self.estimate(self.entries_without_ttl), **self._percentiles(2)),
+            'serializer_overhead': {
+                'total': int(ratio * value_size_total) if (ratio is not None and value_size_total is not None) else None,
+                'ratio': ratio,
+                'inspected': self.inspected,
+                'unparsed': self.unparsed,
+            },
+        }
+
+
+def analyze(functions=None, client=None, sample_rate=0.01, batch_size=1000, max_samples=10000, max_payloads=100, pause=0):
+    # Sizes come from STRLEN/MEMORY USAGE; only up to `max_payloads` values per callable are downloaded (for the overhead).
+    client = client or CacheClient.instantiate()
+    footprints = {}
+
+    def _sampled_keys():
+        for key in iter_cache_keys(client, functions, batch_size):
+            parsed_key = parse_cache_key(key)
+            if parsed_key is None:
+                continue
+
+            qualname = parsed_key[0]
+            if qualname not in footprints:
+                footprints[qualname] = FunctionFootprint(qualname, max_samples)
+            footprints[qualname].entries += 1
+
+            if random.random() < sample_rate:
+                yield key
+
+    requested_payloads = {}
+    for keys in iter_batches(_sampled_keys(), batch_size):
+        payload_keys = []
+        for key, value_size, ttl, memory_usage in client.get_entry_sizes(keys):
+            qualname = parse_cache_key(key)[0]
+            footprints[qualname].add_sample(value_size, ttl, memory_usage)
+
+            if requested_payloads.get(qualname, 0) < max_payloads:
+                requested_payloads[qualname] = requested_payloads.get(qualname, 0) + 1
+                payload_keys.append(key)
+
+        for payload_keys_batch in iter_batches(payload_keys, PAYLOADS_BATCH_SIZE):  # Bounds values held in memory.
+            for key, payload, ttl in client.get_entries(payload_keys_batch):
+                footprints[parse_cache_key(key)[0]].add_payload(payload)
+
+        if pause:
+            time.sleep(pause)  # Be gentle with production servers.
+
+    return sorted(footprints.values(), key=lambda footprint: footprint.estimate(footprint.total_memory_usage) or 0, reverse=True)
+
+
+def _format_size(size):
+    if size is None:
+        return '-'
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if abs(size) < 1024 or unit == 'GB':
+            return '{:.1f}{}'.format(size, unit) if unit != 'B' else '{}B'.format(size)
+        size /= 1024.0
+
+
+def _format_ttl(ttl):
+    return '-' if ttl is None else '{:.0f}s'.format(ttl)
+
+
+def format_report(footprints):
+    header = ('function', 'entries', 'sampled', 'memory', 'value total', 'value p50/p90/p99/max', 'ttl p50/p90/p99/max',
+              'no ttl', 'serializer overhead')
+    rows = [header]
+    for footprint in footprints:
+        data = footprint.as_dict()
+        value_size, ttl, overhead = data['value_size'], data['ttl'], data['serializer_overhead']
+        rows.append((
+            data['qualname'],
+            str(data['entries']),
+            str(data['sampled']),
+            _format_size(data['memory_usage']['total']),
+            _format_size(value_size['total']),
+            '/'.join(_format_size(value_size[name]) for name in ('p50', 'p90', 'p99', 'max')),
+            '/'.join(_format_ttl(ttl[name]) for name in ('p50', 'p90', 'p99', 'max')),
+            '-' if ttl['without_ttl'] is None else str(ttl['without_ttl']),
+            '-' if overhead['ratio'] is None else '{} ({:.0%})'.format(_format_size(overhead['total']), overhead['ratio']),
+        ))
+
+    widths = [max(len(row[column]) for row in rows) for column in range(len(header))]
+    return '\n'.join('  '.join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip() for row in rows)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='pysmartcache-footprint', description='Report the cache footprint of cached callables.')
+    parser.add_argument('functions', nargs='*', help='Qualified names of the cached callables (default: all of them).')
+    parser.add_argument('--sample-rate', type=float, default=0.01, help='Fraction of the entries to inspect (default: 0.01).')
+    parser.add_argument('--batch-size', type=int, default=1000)
+    parser.add_argument('--max-samples', type=int, default=10000, help='Samples kept per callable for percentiles.')
+    parser.add_argument('--max-payloads', type=int, default=100,
+                        help='Values downloaded per callable to measure the serializer overhead.')
+    parser.add_argument('--pause', type=float, default=0, help='Seconds to sleep between batches.')
+    parser.add_argument('--json', action='store_true', help='Output as JSON.')
+    args = parser.parse_args(argv)
+
+    footprints = analyze(args.functions, sample_rate=args.sample_rate, batch_size=args.batch_size,
+                         max_samples=args.max_samples, max_payloads=args.max_payloads, pause=args.pause)
+
+    if args.json:
+        print(json.dumps([footprint.as_dict() for footprint in footprints], indent=2))
+    else:
+        print(format_report(footprints))
+
+
+if __name__ == '__main__':
+    main()  # pragma: no cover
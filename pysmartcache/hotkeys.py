@@ -0,0 +1,136 @@
+import hashlib
+import pickle
+import random
+import threading
+import time
+
+from .constants import CACHE_MISS
+from .utils import get_env_var
+
+
+class CountMinSketch(object):
+    def __init__(self, width=2048, depth=4):
+        self.width = width
+        self.depth = depth
+        self.rows = [[0] * width for _ in range(depth)]
+
+    def _get_indexes(self, key):
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=4 * self.depth).digest()  # 4 bytes per row.
+        for row in range(self.depth):
+            yield row, int.from_bytes(digest[row * 4:row * 4 + 4], 'big') % self.width
+
+    def add(self, key, count=1):
+        estimate = None
+        for row, index in self._get_indexes(key):
+            self.rows[row][index] += count
+            if estimate is None or self.rows[row][index] < estimate:
+                estimate = self.rows[row][index]
+        return estimate
+
+    def estimate(self, key):
+        return min(self.rows[row][index] for row, index in self._get_indexes(key))
+
+    def decay(self):
+        for row in self.rows:
+            for index, value in enumerate(row):
+                row[index] = value >> 1
+
+
+class HotKeyTracker(object):
+    def __init__(self, sample_rate=0.01, top_k=10, min_count=10, local_ttl=1, decay_interval=10000):
+        self.sample_rate = sample_rate
+        self.top_k = top_k
+        self.min_count = min_count
+        self.local_ttl = local_ttl
+        self.decay_interval = decay_interval
+
+        self._sketch = CountMinSketch()
+        self._candidates = {}
+        self._local = {}
+        self._samples = 0
+        self._lock = threading.Lock()
+
+    def _is_hot(self, key):
+        return self._candidates.get(key, 0) >= self.min_count
+
+    def _evict(self, key):
+        del self._candidates[key]
+        self._local.pop(key, None)
+
+    def _decay(self):
+        self._sketch.decay()
+        for key, count in list(self._candidates.items()):
+            if count >> 1:
+                self._candidates[key] = count >> 1
+            else:
+                self._evict(key)
+        self._samples = 0
+
+    def track(self, key):
+        if random.random() >= self.sample_rate:
+            return self._is_hot(key)
+
+        with self._lock:
+            estimate = self._sketch.add(key)
+
+            if (key in self._candidates) or (len(self._candidates) < self.top_k):
+                self._candidates[key] = estimate
+            else:
+                coldest_key = min(self._candidates, key=self._candidates.get)
+                if estimate > self._candidates[coldest_key]:
+                    self._evict(coldest_key)
+                    self._candidates[key] = estimate
+
+            self._samples += 1
+            if self._samples >= self.decay_interval:
+                self._decay()
+
+            return self._is_hot(key)
+
+    def get_local(self, key):
+        payload, expires_at = self._local.get(key, (None, 0))
+        if expires_at <= time.monotonic():
+            return CACHE_MISS
+        return pickle.loads(payload)  # A fresh copy per call, just like the cache clients do.
+
+    def set_local(self, key, value, ttl=None):
+        local_ttl = self.local_ttl if ttl is None else min(self.local_ttl, ttl)
+        payload = pickle.dumps(value)
+        with self._lock:
+            if self._is_hot(key):
+                self._local[key] = (payload, time.monotonic() + local_ttl)
+
+    def top_keys(self):
+        with self._lock:
+            candidates = list(self._candidates.items())
+        return sorted(candidates, key=lambda item: item[1], reverse=True)
+
+    def reset(self):
+        with self._lock:
+            self._sketch = CountMinSketch(self._sketch.width, self._sketch.depth)
+            self._candidates = {}
+            self._local = {}
+            self._samples = 0
+
+
+_tracker = None
+_tracker_lock = threading.Lock()
+
+
+def get_tracker():
+    global _tracker
+
+    if _tracker is None:
+        with _tracker_lock:
+            if _tracker is None:
+                _tracker = HotKeyTracker(
+                    sample_rate=get_env_var('PYSMARTCACHE_HOT_KEYS_SAMPLE_RATE', float, 0.01),
+                    top_k=get_env_var('PYSMARTCACHE_HOT_KEYS_TOP_K', int, 10),
+                    min_count=get_env_var('PYSMARTCACHE_HOT_KEYS_MIN_COUNT', int, 10),
+                    local_ttl=get_env_var('PYSMARTCACHE_HOT_KEYS_LOCAL_TTL', float, 1),
+                )
+    return _tracker
+
+
+def top_keys():
+    return get_tracker().top_keys()
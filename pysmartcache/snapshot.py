@@ -0,0 +1,115 @@
+import argparse
+import gzip
+import struct
+import time
+
+from .clients import CacheClient
+from .exceptions import InvalidSnapshot
+from .utils import iter_batches, iter_cache_keys
+
+SNAPSHOT_MAGIC = b'PYSMARTCACHE-SNAPSHOT-1\n'
+HEADER_FORMAT = struct.Struct('>d')  # Export timestamp.
+RECORD_FORMAT = struct.Struct('>IqI')  # Key length, TTL in milliseconds (-1 means no TTL), payload length.
+
+
+def _open(path, mode):
+    if path.endswith('.gz'):
+        return gzip.open(path, mode)
+    return open(path, mode)
+
+
+def _read_exactly(fileobj, size):
+    data = fileobj.read(size)
+    if len(data) != size:
+        raise InvalidSnapshot('Snapshot is truncated.')
+    return data
+
+
+def iter_entries(client, functions=None, batch_size=1000):
+    for keys in iter_batches(iter_cache_keys(client, functions, batch_size), batch_size):
+        for entry in client.get_entries(keys):
+            yield entry
+
+
+def write_snapshot(fileobj, entries):
+    fileobj.write(SNAPSHOT_MAGIC)
+    fileobj.write(HEADER_FORMAT.pack(time.time()))
+
+    count = 0
+    for key, payload, ttl in entries:
+        encoded_key = key.encode('utf-8')
+        fileobj.write(RECORD_FORMAT.pack(len(encoded_key), -1 if ttl is None else int(ttl * 1000), len(payload)))
+        fileobj.write(encoded_key)
+        fileobj.write(payload)
+        count += 1
+    return count
+
+
+def read_snapshot(fileobj):
+    if fileobj.read(len(SNAPSHOT_MAGIC)) != SNAPSHOT_MAGIC:
+        raise InvalidSnapshot('This is not a PySmartCache snapshot.')
+
+    exported_at, = HEADER_FORMAT.unpack(_read_exactly(fileobj, HEADER_FORMAT.size))
+
+    while True:
+        record = fileobj.read(RECORD_FORMAT.size)
+        if not record:
+            return
+        if len(record) != RECORD_FORMAT.size:
+            raise InvalidSnapshot('Snapshot is truncated.')
+
+        key_length, ttl_in_ms, payload_length = RECORD_FORMAT.unpack(record)
+        key = _read_exactly(fileobj, key_length).decode('utf-8')
+        payload = _read_exactly(fileobj, payload_length)
+        elapsed = max(0, time.time() - exported_at)  # Per record, since long imports restore in batches over time.
+
+        if ttl_in_ms < 0:
+            yield key, payload, None
+        elif ttl_in_ms / 1000.0 > elapsed:
+            yield key, payload, ttl_in_ms / 1000.0 - elapsed
+        # Otherwise this entry has expired since the export, so it is not restored.
+
+
+def export_snapshot(path, functions=None, client=None, batch_size=1000):
+    client = client or CacheClient.instantiate()
+    with _open(path, 'wb') as fileobj:
+        return write_snapshot(fileobj, iter_entries(client, functions, batch_size))
+
+
+def import_snapshot(path, client=None, batch_size=1000):
+    client = client or CacheClient.instantiate()
+
+    count = 0
+    with _open(path, 'rb') as fileobj:
+        for entries in iter_batches(read_snapshot(fileobj), batch_size):
+            client.restore_entries(entries)
+            count += len(entries)
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='pysmartcache-snapshot', description='Export/import PySmartCache entries.')
+    subparsers = parser.add_subparsers(dest='command')
+    subparsers.required = True
+
+    export_parser = subparsers.add_parser('export', help='Export cache entries to a snapshot file.')
+    export_parser.add_argument('path', help='Snapshot file (gzipped if it ends with .gz).')
+    export_parser.add_argument('functions', nargs='*', help='Qualified names of the cached callables (default: all of them).')
+    export_parser.add_argument('--batch-size', type=int, default=1000)
+
+    import_parser = subparsers.add_parser('import', help='Import cache entries from a snapshot file.')
+    import_parser.add_argument('path', help='Snapshot file (gzipped if it ends with .gz).')
+    import_parser.add_argument('--batch-size', type=int, default=1000)
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'export':
+        count = export_snapshot(args.path, args.functions, batch_size=args.batch_size)
+        print('{} entries exported to {}.'.format(count, args.path))
+    else:
+        count = import_snapshot(args.path, batch_size=args.batch_size)
+        print('{} entries imported from {}.'.format(count, args.path))
+
+
+if __name__ == '__main__':
+    main()  # pragma: no cover
@@ -2,10 +2,13 @@ import hashlib
 import inspect
 import os
 import pickle
+import re
 from distutils.util import strtobool
 
 from pysmartcache.exceptions import ImproperlyConfigured
 
+CACHE_KEY_REGEX = re.compile(r'^(?P<qualname>.+)-(?P<uid>[0-9a-f]{32})$')
+
 
 def uid(obj):
     return hashlib.md5(pickle.dumps(obj)).hexdigest()
@@ -46,6 +49,47 @@ def get_cache_key(func, relevant_keys=None, *args, **kwargs):
     return '{}-{}'.format(func.__qualname__, uid(relevant_values))
 
 
+def get_qualname(func):
+    if isinstance(func, str):
+        return func
+    return getattr(func, '__wrapped__', func).__qualname__
+
+
+def get_cache_key_pattern(func=None):
+    if func is None:
+        qualname = '*'
+    else:
+        qualname = re.sub(r'([*?\[\]\\])', r'\\\1', get_qualname(func))  # Escape glob special characters.
+    return '{}-{}'.format(qualname, '[0-9a-f]' * 32)
+
+
+def parse_cache_key(key):
+    match = CACHE_KEY_REGEX.match(key)
+    if not match:
+        return None
+    return match.group('qualname'), match.group('uid')
+
+
+def iter_batches(iterable, batch_size):
+    batch = []
+    for item in iterable:
+        batch.append(item)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+
+    if batch:
+        yield batch
+
+
+def iter_cache_keys(client, functions=None, batch_size=1000):
+    patterns = [get_cache_key_pattern(func) for func in functions] if functions else [get_cache_key_pattern()]
+
+    for pattern in patterns:
+        for key in client.scan_keys(pattern, batch_size):
+            yield key
+
+
 def get_env_var(var_name, cast=None, default=None):
     env_var_value = os.environ.get(var_name)
 
@@ -1,6 +1,9 @@
+import pickle
 import time
 import unittest
 
+import mock
+
 from pysmartcache.clients import CacheClient, DjangoClient, MemcachedClient, RedisClient
 from pysmartcache.constants import CACHE_MISS
 from pysmartcache.exceptions import ImproperlyConfigured
@@ -70,12 +73,56 @@ class ClientBaseTestCase(object):
             self.assertEqual(client.get('impulse'), CACHE_MISS)
             self.assertEqual(client.get('answer'), CACHE_MISS)
 
+    def test_restore_entries(self):
+        with override_env(PYSMARTCACHE_CLIENT=self.client_name, PYSMARTCACHE_HOST=self.client_host):
+            client = CacheClient.instantiate()
+
+            client.restore_entries([('answer', pickle.dumps('42'), 1), ('impulse', pickle.dumps('101'), None)])
+            self.assertEqual(client.get('answer'), '42')
+            self.assertEqual(client.get('impulse'), '101')
+
+            time.sleep(1.1)
+            self.assertEqual(client.get('answer'), CACHE_MISS)  # Expired
+            self.assertEqual(client.get('impulse'), '101')  # No TTL at all.
+
 
 class RedisClientTestCase(ClientBaseTestCase, unittest.TestCase):
     client_name = 'REDIS'
     client_host = '127.0.0.1:6379'
 
+    def test_get_entries_skips_expired_keys(self):
+        client = RedisClient()
+        client._client = mock.Mock()
+        client._client.pipeline.return_value.execute.return_value = [
+            b'answer', 1500,
+            b'impulse', -1,
+            None, -2,
+            b'stale', -2,  # Expired between the pipelined GET and PTTL.
+        ]
+
+        entries = client.get_entries(['answer', 'impulse', 'hamster', 'stale'])
+        self.assertEqual(entries, [('answer', b'answer', 1.5), ('impulse', b'impulse', None)])
+
+    def test_get_entry_sizes_skips_expired_keys(self):
+        client = RedisClient()
+        client._client = mock.Mock()
+        client._client.pipeline.return_value.execute.return_value = [
+            6, 1500, 70,
+            7, -1, 71,
+            0, -2, None,
+        ]
+
+        entry_sizes = client.get_entry_sizes(['answer', 'impulse', 'hamster'])
+        self.assertEqual(entry_sizes, [('answer', 6, 1.5, 70), ('impulse', 7, None, 71)])
+
 
 class MemcachedClientTestCase(ClientBaseTestCase, unittest.TestCase):
     client_name = 'MEMCACHED'
     client_host = '127.0.0.1:11211'
+
+    def test_set_without_ttl(self):
+        client = MemcachedClient()
+        client._client = mock.Mock()
+
+        client.set('answer', '42', None)
+        client._client.set.assert_called_once_with('answer', pickle.dumps('42'), 0)  # pylibmc requires an integer time.
@@ -2,8 +2,12 @@ import time
 import unittest
 import uuid
 
+import mock
+
 from pysmartcache import cache
+from pysmartcache.clients import CacheClient
 from pysmartcache.exceptions import ImproperlyConfigured
+from pysmartcache.hotkeys import HotKeyTracker
 
 from tests.base import override_env
 
@@ -55,6 +59,32 @@ class Example(object):
     def example_method7(self):
         return self.heavy_calculator()
 
+    def example_method8(self):
+        return self.heavy_calculator()
+
+    def example_method9(self):
+        return [self.heavy_calculator()]
+
+
+def documented_function(a):
+    """Some documentation."""
+    return a
+
+
+documented_function.some_attribute = 42
+
+
+class WrapsTestCase(unittest.TestCase):
+    def test_common(self):
+        decorated_function = cache()(documented_function)
+
+        self.assertEqual(decorated_function.__name__, 'documented_function')
+        self.assertEqual(decorated_function.__qualname__, 'documented_function')
+        self.assertEqual(decorated_function.__doc__, 'Some documentation.')
+        self.assertEqual(decorated_function.__module__, documented_function.__module__)
+        self.assertEqual(decorated_function.some_attribute, 42)
+        self.assertIs(decorated_function.__wrapped__, documented_function)
+
 
 class CacheTestCase(unittest.TestCase):
     @classmethod
@@ -76,6 +106,8 @@ class CacheTestCase(unittest.TestCase):
             Example.example_method5 = cache(keys=['self.id', 'let'], cache_exception=True)(Example.example_method5)
             Example.example_method6 = cache(keys=['self.id', 'let'])(Example.example_method6)
             Example.example_method7 = cache(ttl=1, enabled=False)(Example.example_method7)
+            Example.example_method8 = cache(keys=['self.id'], hot_keys=True)(Example.example_method8)
+            Example.example_method9 = cache(keys=['self.id'], hot_keys=True)(Example.example_method9)
 
     def test_ttl_must_be_numeric(self):
         bad_env_vars = self.env_vars.copy()
@@ -234,3 +266,42 @@ class CacheTestCase(unittest.TestCase):
 
             self.assertRaises(SuperWeirdException, example1.example_method6, let='burn')
             self.assertEqual(CALLS_COUNT, 4)
+
+    def test_hot_keys(self):
+        tracker = HotKeyTracker(sample_rate=1, min_count=2, local_ttl=1)
+
+        with override_env(**self.env_vars), mock.patch('pysmartcache.engine.get_tracker', return_value=tracker):
+            example = Example()
+            global CALLS_COUNT
+            CALLS_COUNT = 0
+
+            example.example_method8()
+            self.assertEqual(CALLS_COUNT, 1)
+
+            example.example_method8()
+            self.assertEqual(CALLS_COUNT, 1)  # Cache hit (and now it is a hot key, so it is copied locally).
+            self.assertEqual(len(tracker.top_keys()), 1)
+
+            CacheClient.instantiate().purge()
+            example.example_method8()
+            self.assertEqual(CALLS_COUNT, 1)  # Local copy hit, even though the cache client is empty.
+
+            time.sleep(1.1)
+            example.example_method8()
+            self.assertEqual(CALLS_COUNT, 2)  # Local copy expired (local_ttl), cache miss.
+
+            example.example_method8(_cache_refresh=True)
+            self.assertEqual(CALLS_COUNT, 3)  # Local copy is skipped as well when refreshing.
+
+    def test_hot_keys_do_not_share_values(self):
+        tracker = HotKeyTracker(sample_rate=1, min_count=1, local_ttl=10)
+
+        with override_env(**self.env_vars), mock.patch('pysmartcache.engine.get_tracker', return_value=tracker):
+            example = Example()
+            global CALLS_COUNT
+            CALLS_COUNT = 0
+
+            example.example_method9().append('mutated')
+            example.example_method9().append('mutated')  # Served from the local copy.
+            self.assertEqual(example.example_method9(), [1])
+            self.assertEqual(CALLS_COUNT, 1)
@@ -0,0 +1,172 @@
+import io
+import json
+import pickle
+import unittest
+from contextlib import redirect_stdout
+from datetime import datetime
+from decimal import Decimal
+
+from pysmartcache import cache
+from pysmartcache.clients import CacheClient
+from pysmartcache.footprint import FunctionFootprint, analyze, format_report, get_serializer_overhead, main, percentile
+
+from tests.base import override_env
+
+
+def heavy_calculator(a):
+    return 'x' * a
+
+
+def another_heavy_calculator(a):
+    return a
+
+
+class PercentileTestCase(unittest.TestCase):
+    def test_common(self):
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 0), 1)
+        self.assertEqual(percentile(values, 50), 51)
+        self.assertEqual(percentile(values, 99), 99)
+        self.assertEqual(percentile(values, 100), 100)
+        self.assertEqual(percentile([42], 90), 42)
+        self.assertIsNone(percentile([], 50))
+
+
+class GetSerializerOverheadTestCase(unittest.TestCase):
+    def test_common(self):
+        payload = pickle.dumps('x' * 1000)
+        self.assertEqual(get_serializer_overhead(payload), len(payload) - 1000)
+
+        payload = pickle.dumps(b'x' * 1000)
+        self.assertEqual(get_serializer_overhead(payload), len(payload) - 1000)
+
+        payload = pickle.dumps(list(range(100)))
+        self.assertEqual(get_serializer_overhead(payload), len(payload) - 100)  # 1 byte per small integer.
+
+        payload = pickle.dumps([float(number) for number in range(10)])
+        self.assertEqual(get_serializer_overhead(payload), len(payload) - 80)  # 8 bytes per float.
+
+        payload = pickle.dumps(2 ** 100)
+        self.assertEqual(get_serializer_overhead(payload), len(payload) - 14)  # 13 bytes long, plus its length.
+
+        payload = pickle.dumps(Decimal('1.5'))
+        self.assertEqual(get_serializer_overhead(payload), len(payload) - 3)  # Module and class names are overhead.
+
+        payload = pickle.dumps(Decimal('1.5'), protocol=2)
+        self.assertEqual(get_serializer_overhead(payload), len(payload) - 3)  # Same, through GLOBAL.
+
+        payload = pickle.dumps([Decimal('1.5'), Decimal('2.5')])
+        self.assertEqual(get_serializer_overhead(payload), len(payload) - 6)  # Memoized class is pushed only once.
+
+        payload = pickle.dumps(datetime(2020, 1, 2, 3, 4, 5))
+        self.assertEqual(get_serializer_overhead(payload), len(payload) - 10)  # Packed as 10 bytes.
+
+        self.assertIsNone(get_serializer_overhead(b'hamster'))
+
+
+class FunctionFootprintTestCase(unittest.TestCase):
+    def test_common(self):
+        footprint = FunctionFootprint('heavy_calculator', max_samples=2)
+        footprint.entries = 10
+
+        footprint.add_sample(100, 10, 150)
+        footprint.add_sample(200, 20, 250)
+        footprint.add_sample(300, None, 350)
+        self.assertEqual(len(footprint._samples), 2)  # Reservoir is bounded by max_samples.
+
+        data = footprint.as_dict()
+        self.assertEqual(data['entries'], 10)
+        self.assertEqual(data['sampled'], 3)
+        self.assertEqual(data['value_size']['total'], 2000)  # 600 bytes sampled, extrapolated to 10 entries.
+        self.assertEqual(data['memory_usage']['total'], 2500)
+        self.assertEqual(data['ttl']['without_ttl'], 3)
+        self.assertEqual(data['serializer_overhead'], {'total': None, 'ratio': None, 'inspected': 0, 'unparsed': 0})
+
+        payload = pickle.dumps('x' * 100)
+        footprint.add_payload(payload)
+        overhead = footprint.as_dict()['serializer_overhead']
+        self.assertEqual(overhead['ratio'], (len(payload) - 100) / len(payload))
+        self.assertEqual(overhead['total'], int(overhead['ratio'] * 2000))  # Ratio applied to the estimated value sizes.
+        self.assertEqual(overhead['inspected'], 1)
+
+        footprint.add_payload(b'x' * 1000)  # Not a pickle: left out of the serializer overhead ratio.
+        data = footprint.as_dict()
+        self.assertEqual(data['serializer_overhead']['unparsed'], 1)
+        self.assertEqual(data['serializer_overhead']['inspected'], 2)
+        self.assertEqual(data['serializer_overhead']['ratio'], overhead['ratio'])
+
+        report = format_report([footprint, FunctionFootprint('another_heavy_calculator')])
+        lines = report.splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(lines[1].startswith('heavy_calculator'))
+        self.assertTrue(lines[2].startswith('another_heavy_calculator'))
+
+
+class AnalyzeTestCase(unittest.TestCase):
+    env_vars = {
+        'PYSMARTCACHE_CLIENT': 'REDIS',
+        'PYSMARTCACHE_HOST': '127.0.0.1:6379',
+    }
+
+    def setUp(self):
+        with override_env(**self.env_vars):
+            CacheClient.instantiate().purge()
+
+    def tearDown(self):
+        with override_env(**self.env_vars):
+            CacheClient.instantiate().purge()
+
+    def test_common(self):
+        with override_env(**self.env_vars):
+            cached_heavy_calculator = cache(ttl=100)(heavy_calculator)
+            another_cached_heavy_calculator = cache(ttl=10)(another_heavy_calculator)
+
+            for a in range(1, 11):
+                cached_heavy_calculator(a * 1000)
+            another_cached_heavy_calculator(42)
+            CacheClient.instantiate().set('not-a-cached-callable', 'whatever', 10)
+
+            footprints = analyze(sample_rate=1, batch_size=3, max_payloads=4)
+            self.assertEqual([footprint.qualname for footprint in footprints], ['heavy_calculator', 'another_heavy_calculator'])
+
+            data = footprints[0].as_dict()
+            self.assertEqual(data['entries'], 10)
+            self.assertEqual(data['sampled'], 10)
+            self.assertGreater(data['value_size']['total'], 55000)
+            self.assertGreater(data['memory_usage']['total'], data['value_size']['total'])
+            self.assertTrue(90 < data['ttl']['p50'] <= 100)
+            self.assertEqual(data['ttl']['without_ttl'], 0)
+            self.assertEqual(data['serializer_overhead']['inspected'], 4)  # Bounded by max_payloads.
+            self.assertTrue(0 < data['serializer_overhead']['ratio'] < 0.01)
+
+            footprints = analyze([another_cached_heavy_calculator], sample_rate=1)
+            self.assertEqual([footprint.qualname for footprint in footprints], ['another_heavy_calculator'])
+
+            footprints = analyze(sample_rate=0)
+            self.assertEqual(sum(footprint.entries for footprint in footprints), 11)
+            self.assertEqual(sum(footprint.sampled for footprint in footprints), 0)
+
+    def test_main(self):
+        with override_env(**self.env_vars):
+            cached_heavy_calculator = cache(ttl=100)(heavy_calculator)
+            another_cached_heavy_calculator = cache(ttl=10)(another_heavy_calculator)
+            cached_heavy_calculator(1000)
+            another_cached_heavy_calculator(42)
+
+            output = io.StringIO()
+            with redirect_stdout(output):
+                main(['--sample-rate', '1', '--batch-size', '1'])
+            lines = output.getvalue().splitlines()
+            self.assertEqual(len(lines), 3)
+            self.assertTrue(lines[0].startswith('function'))
+            self.assertTrue(lines[1].startswith('heavy_calculator '))
+            self.assertTrue(lines[2].startswith('another_heavy_calculator '))
+
+            output = io.StringIO()
+            with redirect_stdout(output):
+                main(['another_heavy_calculator', '--json', '--sample-rate', '1', '--max-payloads', '0'])
+            data = json.loads(output.getvalue())
+            self.assertEqual([item['qualname'] for item in data], ['another_heavy_calculator'])
+            self.assertEqual(data[0]['entries'], 1)
+            self.assertEqual(data[0]['sampled'], 1)
+            self.assertEqual(data[0]['serializer_overhead']['inspected'], 0)
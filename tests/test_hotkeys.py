@@ -0,0 +1,94 @@
+import time
+import unittest
+
+from pysmartcache.constants import CACHE_MISS
+from pysmartcache.hotkeys import CountMinSketch, HotKeyTracker
+
+
+class SuperWeirdException(Exception):
+    pass
+
+
+class CountMinSketchTestCase(unittest.TestCase):
+    def test_common(self):
+        sketch = CountMinSketch(width=64, depth=4)
+        self.assertEqual(sketch.estimate('answer'), 0)
+
+        for _ in range(42):
+            sketch.add('answer')
+        sketch.add('impulse', count=101)
+
+        self.assertGreaterEqual(sketch.estimate('answer'), 42)  # Count-min sketch never underestimates.
+        self.assertGreaterEqual(sketch.estimate('impulse'), 101)
+        self.assertEqual(sketch.add('answer'), sketch.estimate('answer'))
+
+    def test_decay(self):
+        sketch = CountMinSketch(width=64, depth=4)
+        sketch.add('answer', count=42)
+        sketch.decay()
+        self.assertEqual(sketch.estimate('answer'), 21)
+
+
+class HotKeyTrackerTestCase(unittest.TestCase):
+    def test_top_keys(self):
+        tracker = HotKeyTracker(sample_rate=1, top_k=2, min_count=3)
+
+        for index in range(5):
+            self.assertEqual(tracker.track('answer'), index >= 2)
+        for _ in range(4):
+            tracker.track('impulse')
+        tracker.track('hamster')
+
+        self.assertEqual([key for key, count in tracker.top_keys()], ['answer', 'impulse'])
+        self.assertTrue(tracker.track('answer'))
+        self.assertFalse(tracker.track('hamster'))
+
+        tracker.reset()
+        self.assertEqual(tracker.top_keys(), [])
+
+    def test_sample_rate(self):
+        tracker = HotKeyTracker(sample_rate=0, min_count=1)
+        for _ in range(10):
+            self.assertFalse(tracker.track('answer'))
+        self.assertEqual(tracker.top_keys(), [])
+
+    def test_decay(self):
+        tracker = HotKeyTracker(sample_rate=1, min_count=2, decay_interval=4)
+        for _ in range(3):
+            tracker.track('answer')
+        self.assertTrue(tracker.track('answer'))  # Fourth sample triggers decay: 4 -> 2.
+        self.assertEqual(tracker.top_keys(), [('answer', 2)])
+
+    def test_local_copy(self):
+        tracker = HotKeyTracker(sample_rate=1, min_count=1, local_ttl=0.5)
+
+        tracker.set_local('answer', '42', 10)
+        self.assertEqual(tracker.get_local('answer'), CACHE_MISS)  # Not hot yet.
+
+        tracker.track('answer')
+        tracker.set_local('answer', '42', 10)
+        self.assertEqual(tracker.get_local('answer'), '42')
+
+        time.sleep(0.6)
+        self.assertEqual(tracker.get_local('answer'), CACHE_MISS)  # Expired (local_ttl).
+
+        tracker.set_local('answer', '42')
+        self.assertEqual(tracker.get_local('answer'), '42')  # Unknown cache ttl: local_ttl only.
+
+        tracker.set_local('answer', '42', 0)
+        self.assertEqual(tracker.get_local('answer'), CACHE_MISS)  # A fresh value never outlives its cache ttl.
+
+    def test_local_copy_is_not_shared(self):
+        tracker = HotKeyTracker(sample_rate=1, min_count=1)
+        tracker.track('answer')
+        tracker.set_local('answer', [1], 10)
+
+        value = tracker.get_local('answer')
+        value.append(2)
+        self.assertEqual(tracker.get_local('answer'), [1])
+        self.assertIsNot(tracker.get_local('answer'), tracker.get_local('answer'))
+
+        exception = SuperWeirdException('Hamsters are upside down!')
+        tracker.set_local('answer', exception, 10)
+        self.assertIsNot(tracker.get_local('answer'), exception)
+        self.assertEqual(str(tracker.get_local('answer')), str(exception))
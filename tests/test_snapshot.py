@@ -0,0 +1,152 @@
+import io
+import os
+import pickle
+import shutil
+import tempfile
+import time
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+
+import mock
+
+from pysmartcache import cache
+from pysmartcache.clients import CacheClient
+from pysmartcache.constants import CACHE_MISS
+from pysmartcache.exceptions import InvalidSnapshot
+from pysmartcache.snapshot import SNAPSHOT_MAGIC, export_snapshot, import_snapshot, main, read_snapshot, write_snapshot
+
+from tests.base import override_env
+
+CALLS_COUNT = 0
+
+
+def heavy_calculator(a):
+    global CALLS_COUNT
+    CALLS_COUNT += 1
+    return a * 2
+
+
+def another_heavy_calculator(a):
+    global CALLS_COUNT
+    CALLS_COUNT += 1
+    return a * 3
+
+
+class SnapshotFileTestCase(unittest.TestCase):
+    def test_common(self):
+        entries = [
+            ('answer-{}'.format('a' * 32), pickle.dumps('42'), 10),
+            ('impulse-{}'.format('b' * 32), pickle.dumps(101), None),
+        ]
+
+        fileobj = io.BytesIO()
+        self.assertEqual(write_snapshot(fileobj, entries), 2)
+
+        fileobj.seek(0)
+        restored = list(read_snapshot(fileobj))
+        self.assertEqual([(key, payload) for key, payload, ttl in restored], [entry[:2] for entry in entries])
+        self.assertTrue(9 < restored[0][2] <= 10)  # Remaining TTL discounts the time since the export.
+        self.assertIsNone(restored[1][2])
+
+    def test_expired_entries_are_skipped(self):
+        fileobj = io.BytesIO()
+        write_snapshot(fileobj, [('answer-{}'.format('a' * 32), pickle.dumps('42'), 0.1)])
+
+        time.sleep(0.2)
+        fileobj.seek(0)
+        self.assertEqual(list(read_snapshot(fileobj)), [])
+
+    def test_elapsed_time_is_discounted_per_record(self):
+        fileobj = io.BytesIO()
+        with mock.patch('pysmartcache.snapshot.time.time', return_value=1000):
+            write_snapshot(fileobj, [('answer-{}'.format('a' * 32), pickle.dumps('42'), 10),
+                                     ('impulse-{}'.format('b' * 32), pickle.dumps(101), 10)])
+
+        fileobj.seek(0)
+        with mock.patch('pysmartcache.snapshot.time.time', side_effect=[1001, 1006]):  # A slow import.
+            restored = list(read_snapshot(fileobj))
+        self.assertEqual([ttl for key, payload, ttl in restored], [9, 4])
+
+    def test_invalid_snapshot(self):
+        self.assertRaises(InvalidSnapshot, list, read_snapshot(io.BytesIO(b'hamster')))
+
+        fileobj = io.BytesIO()
+        write_snapshot(fileobj, [('answer-{}'.format('a' * 32), pickle.dumps('42'), 10)])
+        truncated = io.BytesIO(fileobj.getvalue()[:-1])
+        self.assertRaises(InvalidSnapshot, list, read_snapshot(truncated))
+
+        self.assertRaises(InvalidSnapshot, list, read_snapshot(io.BytesIO(SNAPSHOT_MAGIC)))
+
+    def test_main_requires_a_command(self):
+        with redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+            main([])
+
+
+class SnapshotTestCase(unittest.TestCase):
+    env_vars = {
+        'PYSMARTCACHE_CLIENT': 'REDIS',
+        'PYSMARTCACHE_HOST': '127.0.0.1:6379',
+    }
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        with override_env(**self.env_vars):
+            CacheClient.instantiate().purge()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        with override_env(**self.env_vars):
+            CacheClient.instantiate().purge()
+
+    def test_export_import(self):
+        with override_env(**self.env_vars):
+            cached_heavy_calculator = cache(ttl=10)(heavy_calculator)
+            another_cached_heavy_calculator = cache(ttl=10)(another_heavy_calculator)
+            global CALLS_COUNT
+            CALLS_COUNT = 0
+
+            cached_heavy_calculator(1)
+            cached_heavy_calculator(2)
+            another_cached_heavy_calculator(1)
+            CacheClient.instantiate().set('not-a-cached-callable', 'whatever', 10)
+            self.assertEqual(CALLS_COUNT, 3)
+
+            path = os.path.join(self.directory, 'snapshot.gz')
+            self.assertEqual(export_snapshot(path, [cached_heavy_calculator], batch_size=1), 2)
+            self.assertEqual(export_snapshot(os.path.join(self.directory, 'all'), batch_size=1), 3)
+
+            CacheClient.instantiate().purge()
+            self.assertEqual(import_snapshot(path, batch_size=1), 2)
+
+            self.assertEqual(cached_heavy_calculator(1), 2)
+            self.assertEqual(cached_heavy_calculator(2), 4)
+            self.assertEqual(CALLS_COUNT, 3)  # Cache hits: restored from the snapshot.
+
+            self.assertEqual(another_cached_heavy_calculator(1), 3)
+            self.assertEqual(CALLS_COUNT, 4)  # Cache miss: not exported.
+
+            self.assertEqual(CacheClient.instantiate().get('not-a-cached-callable'), CACHE_MISS)
+
+    def test_main(self):
+        with override_env(**self.env_vars):
+            cached_heavy_calculator = cache(ttl=10)(heavy_calculator)
+            another_cached_heavy_calculator = cache(ttl=10)(another_heavy_calculator)
+            cached_heavy_calculator(1)
+            another_cached_heavy_calculator(1)
+
+            path = os.path.join(self.directory, 'snapshot')
+            output = io.StringIO()
+            with redirect_stdout(output):
+                main(['export', path, 'heavy_calculator', '--batch-size', '1'])
+            self.assertEqual(output.getvalue(), '1 entries exported to {}.\n'.format(path))
+
+            CacheClient.instantiate().purge()
+            output = io.StringIO()
+            with redirect_stdout(output):
+                main(['import', path])
+            self.assertEqual(output.getvalue(), '1 entries imported from {}.\n'.format(path))
+
+            global CALLS_COUNT
+            CALLS_COUNT = 0
+            self.assertEqual(cached_heavy_calculator(1), 2)
+            self.assertEqual(CALLS_COUNT, 0)  # Cache hit: restored from the snapshot.
@@ -4,8 +4,9 @@ from decimal import Decimal
 
 import mock
 
+from pysmartcache import cache
 from pysmartcache.exceptions import ImproperlyConfigured
-from pysmartcache.utils import depth_getattr, get_env_var, uid
+from pysmartcache.utils import depth_getattr, get_cache_key, get_cache_key_pattern, get_env_var, iter_batches, parse_cache_key, uid
 
 
 class Fixture1(object):
@@ -80,6 +81,40 @@ class DepthGetattrTestCase(unittest.TestCase):
         self.assertEqual(str(e.exception), "'int' object has no attribute 'boom'")
 
 
+class GetCacheKeyPatternTestCase(unittest.TestCase):
+    def test_common(self):
+        hex_pattern = '[0-9a-f]' * 32
+
+        self.assertEqual(get_cache_key_pattern(), '*-{}'.format(hex_pattern))
+        self.assertEqual(get_cache_key_pattern('Fixture1.method'), 'Fixture1.method-{}'.format(hex_pattern))
+        self.assertEqual(get_cache_key_pattern('weird*[name]?'), r'weird\*\[name\]\?-{}'.format(hex_pattern))
+
+        def some_function(a):
+            return a
+
+        self.assertEqual(get_cache_key_pattern(some_function), '{}-{}'.format(some_function.__qualname__, hex_pattern))
+        self.assertTrue(get_cache_key(some_function, None, 42).startswith(some_function.__qualname__ + '-'))
+
+        decorated_function = cache()(some_function)
+        self.assertEqual(get_cache_key_pattern(decorated_function), get_cache_key_pattern(some_function))
+
+
+class ParseCacheKeyTestCase(unittest.TestCase):
+    def test_common(self):
+        self.assertEqual(parse_cache_key('Some.<locals>.thing-{}'.format('a' * 32)), ('Some.<locals>.thing', 'a' * 32))
+        self.assertEqual(parse_cache_key('with-dashes-{}'.format('0' * 32)), ('with-dashes', '0' * 32))
+        self.assertIsNone(parse_cache_key('answer'))
+        self.assertIsNone(parse_cache_key('answer-{}'.format('A' * 32)))
+        self.assertIsNone(parse_cache_key('-{}'.format('a' * 32)))
+
+
+class IterBatchesTestCase(unittest.TestCase):
+    def test_common(self):
+        self.assertEqual(list(iter_batches(range(5), 2)), [[0, 1], [2, 3], [4]])
+        self.assertEqual(list(iter_batches(range(4), 2)), [[0, 1], [2, 3]])
+        self.assertEqual(list(iter_batches([], 2)), [])
+
+
 @mock.patch('pysmartcache.utils.os')
 class GetEnvVarTestCase(unittest.TestCase):
     def test_bool_positive_values(self, os_patched):